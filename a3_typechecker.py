@@ -35,6 +35,7 @@ builtins.input = disable_input
 builtins.open = disable_open
 
 import twitterverse_functions
+import twitterverse_validation
 
 # typecheck the twitterverse_functions.py functions
 
@@ -42,88 +43,22 @@ import twitterverse_functions
 open_data_file = our_open('small_data.txt')
 result = twitterverse_functions.process_data(open_data_file)
 open_data_file.close()
-assert isinstance(result, dict), \
-    '''process_data should return a dict, but returned {0}''' \
-    .format(type(result))
-for item in result:
-    assert isinstance(item, str), \
-        'process_data should return a dict with str keys, ' \
-        'but returned a dict with {0} keys'\
-        .format(type(item))
-    assert isinstance(result[item], dict), \
-           'process_data should return a dict with dict values, but returned ' \
-           'a dict with {0} values'\
-           .format(type(result[item]))
-    for key in result[item]:
-        assert isinstance(key, str), \
-                'process_data should return an inner dict with str keys, ' \
-                'but returned an inner dict with {0} keys'\
-                .format(type(key))   
-        assert isinstance(result[item][key], str) or \
-               isinstance(result[item][key], list), \
-                'process_data should return an inner dict with str or list '\
-                'values, but returned an inner dict with {0} values'\
-                .format(type(item))        
-   
-   
+errors = twitterverse_validation.validate_twitterverse(result)
+assert errors == [], \
+    'process_data should return a Twitterverse dictionary, but:\n{0}' \
+    .format('\n'.join(errors))
+
+
 # Type check twitterverse_functions.process_query
 open_query_file = our_open('typecheck_query.txt') 
 result = twitterverse_functions.process_query(open_query_file)
 open_query_file.close()
-assert isinstance(result, dict), \
-    '''process_query should return a dict, but returned {0}''' \
-    .format(type(result))
-
-# Query dictionary
-assert 'search' in result, '''key 'search' missing from query dictionary'''
-assert 'filter' in result, '''key 'filter' missing from query dictionary'''
-assert 'present' in result, '''key 'present' missing from query dictionary'''
-assert len(result) == 3, '''query dictionary has incorrect length'''
-
-# Search specification
-assert len(result['search']) == 2, \
-       '''search spec dictionary has incorrect length'''
-assert 'username' in result['search'], \
-       '''key 'username' missing from search specification dictionary'''
-assert isinstance(result['search']['username'], str), \
-       "key 'username' should have value of type str, " \
-       "but has value of type {0}"\
-       .format(type(result['search']['username']))       
-assert 'operations' in result['search'], \
-       '''key 'operations' missing from search specification dictionary'''
-assert isinstance(result['search']['operations'], list), \
-       "key 'operations' should have value of type list, " \
-       "but has value of type {0}"\
-       .format(type(result['search']['operations']))
-
-# Filter specification
+errors = twitterverse_validation.validate_query(result)
+assert errors == [], \
+    'process_query should return a Query dictionary, but:\n{0}' \
+    .format('\n'.join(errors))
 assert len(result['filter']) == 4, \
        '''filter spec dictionary has incorrect length'''
-for item in result['filter']:
-    assert item in ['following', 'follower', 'name-includes', \
-                    'location-includes'], \
-        '''invalid key {0} in filter specification dictionary'''\
-        .format(item)   
-    assert isinstance(result['filter'][item], str), \
-        'values in filter specification dictionary should have type str, ' \
-        'but has type {0}'\
-        .format(type(result['filter'][item]))
-    
-# Presentation specification
-assert len(result['present']) == 2, \
-       '''present spec dictionary has incorrect length'''
-assert 'sort-by' in result['present'], \
-       '''key 'sort-by' missing from present specification dictionary'''
-assert isinstance(result['present']['sort-by'], str), \
-       "key 'sort-by' should have value of type str, " \
-       "but has value of type {0}"\
-       .format(type(result['present']['sort-by']))  
-assert 'format' in result['present'], \
-       '''key 'format' missing from present specification dictionary'''
-assert isinstance(result['present']['format'], str), \
-       "key 'format' should have value of type str, " \
-       "but has value of type {0}"\
-       .format(type(result['present']['format']))  
 
 
 # Type check twitterverse_functions.get_search_results
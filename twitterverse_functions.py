@@ -26,15 +26,47 @@ Filter specification dictionary: dict of {str: str}
    - key "follower" might exist, value represents a username (a str)
    - key "name-includes" might exist, value represents a str to match (a case-insensitive match)
    - key "location-includes" might exist, value represents a str to match (a case-insensitive match)
+   - key "bio-includes" might exist, value represents a phrase to match in the bio (a case-insensitive match of whole words)
+   - key "bio-terms" might exist, value represents words to match in the bio, joined by AND (the default between words) and OR (in any case)
 
 Presentation specification dictionary: dict of {str: str}
    - key "sort-by", value represents how to sort results (a str)
    - key "format", value represents how to format results (a str)
+
+Bio index: dict of {str: dict of {str: list of int}}
+   - each key is a lowercase word appearing in some user's bio (a str)
+   - each value maps the username of each user whose bio has that word to the
+     positions of the word in that user's tokenized bio (a list of int)
        
 """
 
+import collections.abc
+import gc
+import io
+import locale
+import mmap
+import multiprocessing
+import os
+import pickle
+import re
+
 # Write your Twitterverse functions here
 
+PROFILE_KEYS = ['name', 'location', 'web', 'bio']
+
+# Patterns for process_data_lazy, which reads the data file as bytes. A line
+# matches a keyword if it is the keyword apart from whitespace, as with
+# line.strip() in process_data.
+LINE_SPACE = rb'[ \t\r\x0b\x0c]*'
+# The name, location, web and bio lines, up to and including ENDBIO.
+PROFILE = (rb'(?:[^\n]*\n){3}(?:[^\n]*\n)*?' + LINE_SPACE + rb'ENDBIO' +
+           LINE_SPACE + rb'\n')
+PROFILE_PATTERN = re.compile(PROFILE)
+# A whole record: the username line, the profile and the following lines,
+# up to and including END.
+RECORD_PATTERN = re.compile(rb'([^\n]*)\n(' + PROFILE + rb')((?:[^\n]*\n)*?)' +
+                            LINE_SPACE + rb'END' + LINE_SPACE + rb'(?:\n|\Z)')
+
 def process_data(data_file):
     """(file open for reading) -> Twitterverse dictionary
     
@@ -53,33 +85,442 @@ def process_data(data_file):
 
     """
     data_dict = {}
-    line = ''
     username = data_file.readline().strip()
     while username != '':
         
-        data_dict[username] = {}
-        data_dict[username]['name'] = data_file.readline().strip()
-        data_dict[username]['location'] = data_file.readline().strip()
-        data_dict[username]['web'] = data_file.readline().strip()
-       
+        data_dict[username] = _read_profile(data_file)
+        data_dict[username]['following'] = _read_following(data_file,
+                                                           username)
+        username = data_file.readline().strip()
+        
+    return data_dict
+
+def _read_following(data_file, username):
+    """(file open for reading, str) -> list of str
+    
+    Read the lines of the users that the user username follows (up to and
+    including the END line) from data_file and return them as a list.
+    """
+    line = ''
+    following = []
+    
+    while line.strip() != 'END':
+        line = data_file.readline()
+        if line == '':
+            raise ValueError('data file ended before END for user ' +
+                             username)
+        following.append(line.strip())
+    return following[:-1]
+
+def _read_profile(data_file):
+    """(file open for reading) -> dict of {str: str}
+    
+    Read a user's name, location, web and bio lines (up to and including the
+    ENDBIO line) from data_file and return them as a dict with keys 'name',
+    'location', 'web' and 'bio'.
+    """
+    profile = {}
+    profile['name'] = data_file.readline().strip()
+    profile['location'] = data_file.readline().strip()
+    profile['web'] = data_file.readline().strip()
+    
+    bio = ''
+    line = ''
+    while line.strip() != 'ENDBIO':
+        line = data_file.readline()
+        if line == '':
+            raise ValueError('data file ended before ENDBIO')
+        bio += line
+    
+    profile['bio'] = bio[:-8]
+    return profile
+
+def process_data_lazy(data_filename):
+    """(str) -> Twitterverse dictionary
+    
+    Precondition: data_filename names a data file in the format read by
+    process_data, with lines ending in '\\n' or '\\r\\n', and the file is
+    not changed or removed while the result is in use.
+    
+    Read the data file named data_filename and return the data in the
+    Twitterverse dictionary format, like process_data. Only each user's
+    'following' list is read now; the 'name', 'location', 'web' and 'bio'
+    values are read from the file the first time one of them is used (see
+    LazyUser). build_bio_index reads the bios without keeping them.
+    
+    >>> import os, tempfile
+    >>> data_file = tempfile.NamedTemporaryFile('w', delete=False)
+    >>> _ = data_file.write('tomCruise\\nTom Cruise\\nLos Angeles, CA\\n'
+    ...     'http://www.tomcruise.com\\nOfficial TomCruise.com crew tweets.\\n'
+    ...     'END\\nENDBIO\\nkatieH\\nEND\\n'
+    ...     'katieH\\nKatie Holmes\\n\\nwww.tomkat.com\\nENDBIO\\nEND\\n')
+    >>> data_file.close()
+    >>> result = process_data_lazy(data_file.name)
+    >>> result['tomCruise']['following']
+    ['katieH']
+    >>> result['tomCruise']['name']
+    'Tom Cruise'
+    >>> with open(data_file.name) as f:
+    ...     result == process_data(f)
+    True
+    >>> result['katieH'].copy() == {'name': 'Katie Holmes', 'location': '', \
+'web': 'www.tomkat.com', 'bio': '', 'following': []}
+    True
+    >>> del result
+    >>> os.remove(data_file.name)
+    """
+    encoding = locale.getpreferredencoding(False)
+    data_dict = {}
+    
+    with open(data_filename, 'rb') as data_file:
+        if os.fstat(data_file.fileno()).st_size == 0:
+            return data_dict
+        # The map stays open after the file is closed, and every LazyUser
+        # reads its fields from it.
+        data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+    source = (data, encoding)
+    
+    # The loop makes many objects but no reference cycles, so pause the cycle
+    # collector rather than let it rescan the growing dictionary.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        position = 0
+        record = RECORD_PATTERN.match(data, position)
+        while record is not None:
+            
+            username = record.group(1).decode(encoding).strip()
+            if username == '':
+                return data_dict
+            following = record.group(3).decode(encoding).split('\n')
+            following.pop()
+            
+            data_dict[username] = LazyUser(source, record.start(2),
+                                           list(map(str.strip, following)))
+            position = record.end()
+            record = RECORD_PATTERN.match(data, position)
+    finally:
+        if collecting:
+            gc.enable()
+    
+    end = data.find(b'\n', position)
+    if end == -1:
+        end = len(data)
+    if data[position:end].strip() != b'':
+        raise ValueError('data file ended before ENDBIO or END for user ' +
+                         data[position:end].decode(encoding).strip())
+    return data_dict
+
+class LazyUser(collections.abc.MutableMapping):
+    """A user's dict in a Twitterverse dictionary returned by
+    process_data_lazy.
+    
+    At first only the 'following' list is stored. The first time the 'name',
+    'location', 'web' or 'bio' item is needed, all four are read from the
+    data file and stored, after which the LazyUser holds the same items, in
+    the same order, as the dict that process_data would have built.
+    
+    >>> import os, tempfile
+    >>> data_file = tempfile.NamedTemporaryFile('w', delete=False)
+    >>> _ = data_file.write('a\\nA\\nOz\\n\\nLove\\nmusic\\nENDBIO\\nb\\nEND\\n')
+    >>> data_file.close()
+    >>> user = process_data_lazy(data_file.name)['a']
+    >>> list(user)
+    ['name', 'location', 'web', 'bio', 'following']
+    >>> user.is_loaded() or ('bio' in user and len(user))
+    5
+    >>> user['following'] == ['b'] and not user.is_loaded()
+    True
+    >>> user.peek('bio')
+    'Love\\nmusic'
+    >>> user.is_loaded()
+    False
+    >>> user['bio']
+    'Love\\nmusic'
+    >>> user
+    {'name': 'A', 'location': 'Oz', 'web': '', 'bio': 'Love\\nmusic', 'following': ['b']}
+    >>> del user
+    >>> os.remove(data_file.name)
+    """
+    
+    __slots__ = ['_source', '_start', '_following', '_items']
+    
+    def __init__(self, source, start, following):
+        """ (LazyUser, (mmap, str), int, list of str) -> NoneType
         
-        bio = ''
+        Initialize a user whose name line starts at start in the data of
+        source = (data, encoding).
+        """
+        self._source = source
+        self._start = start
+        self._following = following
+        self._items = None
+    
+    def peek(self, key):
+        """ (LazyUser, str) -> object
         
-        while line.strip() != 'ENDBIO':
-            line = data_file.readline()
-            bio += line
+        Return the value for key, reading it from the data file without
+        storing it if the user has not been loaded.
+        """
+        if self._items is not None:
+            return self._items[key]
+        if key == 'following':
+            return self._following
+        if key not in PROFILE_KEYS:
+            raise KeyError(key)
+        return self._read_profile()[key]
+    
+    def _read_profile(self):
+        """ (LazyUser) -> dict of {str: str}
         
-        data_dict[username]['bio'] = bio[:-8]
-        following = []
+        Read and return the user's name, location, web and bio items, as
+        _read_profile does, without storing them.
+        """
+        data, encoding = self._source
+        end = PROFILE_PATTERN.match(data, self._start).end()
+        text = data[self._start:end].decode(encoding)
+        # newline=None reads lines the way a file opened with 'r' does.
+        return _read_profile(io.StringIO(text, newline=None))
+    
+    def is_loaded(self):
+        """ (LazyUser) -> bool
         
-        while line.strip() != 'END':
-            line = data_file.readline()
-            following.append(line.strip())
-        data_dict[username]['following'] = following[:-1]
-        username = data_file.readline().strip()
+        Return whether the user's name, location, web and bio items have been
+        read from the data file.
+        """
+        return self._items is not None
+    
+    def _load(self):
+        """ (LazyUser) -> NoneType
+        
+        Read and store the name, location, web and bio items if they have not
+        been read yet.
+        """
+        if self._items is None:
+            items = self._read_profile()
+            items['following'] = self._following
+            self._items = items
+            self._source = None
+    
+    def __getitem__(self, key):
+        if self._items is None:
+            if key == 'following':
+                return self._following
+            if key not in PROFILE_KEYS:
+                raise KeyError(key)
+            self._load()
+        return self._items[key]
+    
+    def __setitem__(self, key, value):
+        self._load()
+        self._items[key] = value
+    
+    def __delitem__(self, key):
+        self._load()
+        del self._items[key]
+    
+    def __iter__(self):
+        if self._items is None:
+            return iter(PROFILE_KEYS + ['following'])
+        return iter(self._items)
+    
+    def __len__(self):
+        if self._items is None:
+            return len(PROFILE_KEYS) + 1
+        return len(self._items)
+    
+    def __contains__(self, key):
+        if self._items is None:
+            return key == 'following' or key in PROFILE_KEYS
+        return key in self._items
+    
+    def __repr__(self):
+        self._load()
+        return repr(self._items)
+    
+    def __reduce__(self):
+        # Save (and copy) as a plain dict, which no longer needs the file.
+        return (dict, (self.copy(),))
+    
+    def copy(self):
+        """ (LazyUser) -> dict of {str: object}
         
+        Return a dict with the same items as this user.
+        """
+        self._load()
+        return dict(self._items)
+
+def process_data_parallel(data_filename, processes=None):
+    """(str, int) -> Twitterverse dictionary
+    
+    Precondition: data_filename names a data file in the format read by
+    process_data.
+    
+    Read the data file named data_filename using a pool of processes worker
+    processes (one per CPU if processes is None) and return the data in the
+    Twitterverse dictionary format. The result is the same, user for user
+    and in the same order, as calling process_data on the whole file.
+    
+    The file is split into byte ranges that start right after the END line
+    that closes a record, so every range holds only complete records.
+    
+    >>> import os, tempfile
+    >>> data_file = tempfile.NamedTemporaryFile('w', delete=False)
+    >>> for i in range(200):
+    ...     _ = data_file.write('user{0}\\nName\\nOz\\n\\nEND\\nuser{1}\\nENDBIO\\n'
+    ...                         'user{1}\\nEND\\n'.format(i, i + 1))
+    >>> data_file.close()
+    >>> result = process_data_parallel(data_file.name, 8)
+    >>> result['user7']
+    {'name': 'Name', 'location': 'Oz', 'web': '', 'bio': 'END\\nuser8', 'following': ['user8']}
+    >>> with open(data_file.name) as f:
+    ...     result == process_data(f)
+    True
+    
+    process_data stops at a blank line between records, and so does this.
+    
+    >>> data_file = open(data_file.name, 'w')
+    >>> for i in range(100):
+    ...     _ = data_file.write('user{0}\\nName\\nOz\\n\\nENDBIO\\nEND\\n'.format(i))
+    ...     if i == 49:
+    ...         _ = data_file.write('\\n')
+    >>> data_file.close()
+    >>> result = process_data_parallel(data_file.name, 4)
+    >>> len(result)
+    50
+    >>> with open(data_file.name) as f:
+    ...     result == process_data(f)
+    True
+    >>> os.remove(data_file.name)
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    
+    boundaries = _find_record_boundaries(data_filename, processes)
+    chunks = []
+    for i in range(len(boundaries) - 1):
+        chunks.append((data_filename, boundaries[i], boundaries[i + 1]))
+    
+    # Rebuilding the users makes many objects but no reference cycles, so
+    # pause the cycle collector rather than let it rescan the dictionary.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        data_dict = {}
+        if len(chunks) <= 1:
+            for chunk in chunks:
+                _add_records(data_dict, _process_data_chunk(chunk)[1])
+        else:
+            # imap hands back the chunks in file order as they are parsed, so
+            # the parent rebuilds one chunk while the workers parse the rest.
+            # process_data stops at a blank username line, so once a chunk
+            # stops there the later chunks are dropped.
+            with multiprocessing.Pool(min(processes, len(chunks))) as pool:
+                for stopped, fields in pool.imap(_process_data_chunk, chunks):
+                    _add_records(data_dict, fields)
+                    if stopped:
+                        break
+    finally:
+        if collecting:
+            gc.enable()
+    
     return data_dict
 
+def _find_record_boundaries(data_filename, count):
+    """(str, int) -> list of int
+    
+    Return the sorted byte offsets that split the file named data_filename
+    into at most count ranges of whole records. The first offset is 0 and
+    the last is the size of the file.
+    
+    >>> import os, tempfile
+    >>> data_file = tempfile.NamedTemporaryFile('w', delete=False)
+    >>> _ = data_file.write('a\\n\\n\\n\\nEND\\nb\\nENDBIO\\nb\\nEND\\n'
+    ...                     'b\\n\\n\\n\\nEND\\na\\nENDBIO\\nEND\\n')
+    >>> data_file.close()
+    >>> _find_record_boundaries(data_file.name, 4)
+    [0, 24, 46]
+    >>> os.remove(data_file.name)
+    """
+    size = os.path.getsize(data_filename)
+    boundaries = [0]
+    
+    with open(data_filename, 'rb') as data_file:
+        for i in range(1, count):
+            offset = size * i // count
+            if offset <= boundaries[-1]:
+                continue
+            
+            # Skip the rest of the line before the offset, then look
+            # for an ENDBIO line. A bio cannot hold ENDBIO, so the first END
+            # line after it closes a record, even if a bio has END lines.
+            data_file.seek(offset - 1)
+            data_file.readline()
+            line = data_file.readline()
+            while line != b'' and line.strip() != b'ENDBIO':
+                line = data_file.readline()
+            while line != b'' and line.strip() != b'END':
+                line = data_file.readline()
+            
+            position = data_file.tell()
+            if line == b'' or data_file.readline().strip() == b'':
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+    
+    if size > boundaries[-1]:
+        boundaries.append(size)
+    return boundaries
+
+def _process_data_chunk(chunk):
+    """((str, int, int)) -> (bool, list of object)
+    
+    Read the records between the start and end byte offsets of the file named
+    in chunk = (filename, start, end) as process_data would, and return
+    whether reading stopped at a blank username line before the end, and the
+    records as one flat list: for each user, the username, name, location,
+    web and bio, the number of users followed, then their usernames. A flat
+    list of str is much cheaper to send back to the parent than nested dicts.
+    """
+    data_filename, start, end = chunk
+    with open(data_filename, 'rb') as data_file:
+        data_file.seek(start)
+        data = data_file.read(end - start)
+    
+    # Decode the same way open(data_filename, 'r') would for process_data.
+    data_file = io.TextIOWrapper(io.BytesIO(data))
+    fields = []
+    line = data_file.readline()
+    username = line.strip()
+    while username != '':
+        
+        profile = _read_profile(data_file)
+        following = _read_following(data_file, username)
+        fields.extend([username, profile['name'], profile['location'],
+                       profile['web'], profile['bio'], len(following)])
+        fields.extend(following)
+        line = data_file.readline()
+        username = line.strip()
+    
+    return line != '', fields
+
+def _add_records(data_dict, fields):
+    """(Twitterverse dictionary, list of object) -> NoneType
+    
+    Add the users in fields, a flat list of records returned by
+    _process_data_chunk, to data_dict.
+    """
+    i = 0
+    size = len(fields)
+    while i < size:
+        end = i + 6 + fields[i + 5]
+        data_dict[fields[i]] = {'name': fields[i + 1],
+                                'location': fields[i + 2],
+                                'web': fields[i + 3],
+                                'bio': fields[i + 4],
+                                'following': fields[i + 6:end]}
+        i = end
+
 def process_query(query_file):
     """(file open for reading) -> query dictionary
     
@@ -130,7 +571,7 @@ def process_query(query_file):
             
             for item in exam:
                 item = item.strip()
-                item = item.split()
+                item = item.split(None, 1)
                 
                 query_dict['filter'][item[0]] = item[-1]
                 
@@ -238,23 +679,46 @@ def get_search_results(data_dict, search_dict):
     
     return lst
 
-def get_filter_results(data_dict, usernames, filter_dict):
-    """(Twitterverse dictionary, list of str, filter specification dictionary) -> list of str
+def get_filter_results(data_dict, usernames, filter_dict, bio_index=None):
+    """(Twitterverse dictionary, list of str, filter specification dictionary, Bio index) -> list of str
     
     Apply the specified filters to the given username list to determine which usernames to keep, and return the resulting list of usernames.
     
+    The bio-includes and bio-terms filters use bio_index, which should be built once with build_bio_index when the data is loaded. If bio_index is None, it is built from data_dict.
+    
     >>> data_dict = {'NicoleKidman': {'following': [], 'web': '', 'location': 'Oz', 'name': 'Nicole Kidman', 'bio': "At my house celebrating Halloween! I Know Haven't been on like\\nyears So Sorry,Be safe And have fun tonight"}, 'katieH': {'following': [], 'web': 'www.tomkat.com', 'location': '', 'name': 'Katie Holmes', 'bio': ''}, 'PerezHilton': {'following': ['tomCruise', 'katieH', 'NicoleKidman'], 'web': 'http://www.PerezH...', 'location': 'Hollywood, California', 'name': 'Perez Hilton', 'bio': 'Perez Hilton is the creator and writer of one of the most famous websites\\nin the world. And he also loves music - a lot!'}, 'tomCruise': {'following': ['katieH', 'NicoleKidman'], 'web': 'http://www.tomcruise.com', 'location': 'Los Angeles, CA', 'name': 'Tom Cruise', 'bio': 'Official TomCruise.com crew tweets. We love you guys!\\nVisit us at Facebook!'}}
     
     >>> filter_dict = {'following': 'katieH'} 
     >>> usernames = ['katieH', 'NicoleKidman', 'tomCruise', 'PerezHilton']
     >>> get_filter_results(data_dict, usernames, filter_dict)
     ['tomCruise', 'PerezHilton']
+    
+    >>> bio_index = build_bio_index(data_dict)
+    >>> filter_dict = {'bio-terms': 'music OR facebook'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    ['tomCruise', 'PerezHilton']
+    >>> filter_dict = {'bio-terms': 'zebra'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    []
+    >>> filter_dict = {'bio-includes': 'music loves'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    []
+    >>> filter_dict = {'bio-terms': 'facebook', 'following': 'katieH'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    ['tomCruise']
+    >>> filter_dict = {'bio-terms': 'facebook', 'following': 'tomCruise'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    []
+    >>> filter_dict = {'following': 'katieH', 'bio-terms': 'movies'}
+    >>> get_filter_results(data_dict, usernames, filter_dict, bio_index)
+    []
     """
     lst_name = []
     lst_loc = []
     lst_follower = []
     lst_following = []
-    for_all = []
+    # None until the first filter has been applied.
+    for_all = None
     
     for item in filter_dict:
         
@@ -264,7 +728,7 @@ def get_filter_results(data_dict, usernames, filter_dict):
                         lst_name.append(user)
                 if user not in lst_name:
                     usernames.remove(user)
-                if for_all == []:
+                if for_all is None:
                         for_all =lst_name
                 else:
                     for item in for_all:
@@ -278,7 +742,7 @@ def get_filter_results(data_dict, usernames, filter_dict):
                         
                 if user not in lst_loc:
                     usernames.remove(user)
-                    if for_all == []:
+                    if for_all is None:
                         for_all =lst_loc
                     else:
                         for item in for_all:
@@ -295,7 +759,7 @@ def get_filter_results(data_dict, usernames, filter_dict):
                     if user in follower:
                         lst_following.append(user)
                         
-                if for_all == []:
+                if for_all is None:
                         for_all =lst_following
                 else:
                     for item in for_all:
@@ -311,13 +775,32 @@ def get_filter_results(data_dict, usernames, filter_dict):
                 if user not in lst_follower:
                     usernames.remove(user) 
                     
-                if for_all == []:
+                if for_all is None:
                     for_all =lst_follower
                 else:
                     for item in for_all:
                         if item not in lst_follower:
                             for_all.remove(item)                    
-    if for_all == []:
+
+            elif item == 'bio-includes' or item == 'bio-terms':
+                if bio_index is None:
+                    bio_index = build_bio_index(data_dict)
+                if item == 'bio-includes':
+                    matches = bio_phrase_search(data_dict, bio_index,
+                                                filter_dict[item])
+                else:
+                    matches = bio_terms_search(data_dict, bio_index,
+                                               filter_dict[item])
+                lst_bio = []
+                for user in usernames:
+                    if user in matches:
+                        lst_bio.append(user)
+                
+                if for_all is None:
+                    for_all = lst_bio
+                else:
+                    for_all = [user for user in for_all if user in lst_bio]
+    if for_all is None:
         for_all = usernames
         
     return for_all
@@ -353,6 +836,169 @@ def get_present_string(data_dict, usernames, present_dict):
     return present
 
 
+# --- Bio Search Functions ---
+def tokenize_bio(bio):
+    """ (str) -> list of str
+    
+    Return the lowercase words in bio, in order.
+    
+    >>> tokenize_bio("We love you guys!\\nVisit us at Facebook!")
+    ['we', 'love', 'you', 'guys', 'visit', 'us', 'at', 'facebook']
+    >>> tokenize_bio("Haven't been on")
+    ["haven't", 'been', 'on']
+    """
+    
+    return re.findall(r"\w+(?:'\w+)*", bio.lower())
+
+def build_bio_index(twitter_data):
+    """ (Twitterverse dictionary) -> Bio index
+    
+    Return a Bio index of the bios in twitter_data.
+    
+    >>> twitter_data = {\
+    'a':{'name':'', 'location':'', 'web':'', 'bio':'Love music', 'following':[]}, \
+    'b':{'name':'', 'location':'', 'web':'', 'bio':'music, music', 'following':[]}}
+    >>> bio_index = build_bio_index(twitter_data)
+    >>> bio_index['music']
+    {'a': [1], 'b': [0, 1]}
+    >>> bio_index['love']
+    {'a': [0]}
+    """
+    
+    bio_index = {}
+    for user in twitter_data:
+        user_data = twitter_data[user]
+        if isinstance(user_data, LazyUser):
+            # Read the bio without keeping the user's other text fields.
+            words = tokenize_bio(user_data.peek('bio'))
+        else:
+            words = tokenize_bio(user_data['bio'])
+        for position in range(len(words)):
+            postings = bio_index.setdefault(words[position], {})
+            postings.setdefault(user, []).append(position)
+    return bio_index
+
+def bio_terms_search(twitter_data, bio_index, terms):
+    """ (Twitterverse dictionary, Bio index, str) -> set of str
+    
+    Return the usernames in twitter_data whose bios match terms, using
+    bio_index, the Bio index of twitter_data.
+    
+    terms is a list of words joined by the operators AND and OR (in any
+    case). Words next to each other are joined by AND, and AND comes before
+    OR: 'a b OR c' matches bios that have both a and b, or that have c. If
+    terms has no words, every user matches.
+    
+    >>> twitter_data = {\
+    'a':{'name':'', 'location':'', 'web':'', 'bio':'Love music', 'following':[]}, \
+    'b':{'name':'', 'location':'', 'web':'', 'bio':'music, music', 'following':[]}, \
+    'c':{'name':'', 'location':'', 'web':'', 'bio':'Movies', 'following':[]}, \
+    'd':{'name':'', 'location':'', 'web':'', 'bio':'', 'following':[]}}
+    >>> bio_index = build_bio_index(twitter_data)
+    >>> sorted(bio_terms_search(twitter_data, bio_index, 'MUSIC love'))
+    ['a']
+    >>> sorted(bio_terms_search(twitter_data, bio_index, 'music AND love'))
+    ['a']
+    >>> sorted(bio_terms_search(twitter_data, bio_index, 'love or movies'))
+    ['a', 'c']
+    >>> sorted(bio_terms_search(twitter_data, bio_index, 'zebra'))
+    []
+    >>> sorted(bio_terms_search(twitter_data, bio_index, ''))
+    ['a', 'b', 'c', 'd']
+    """
+    
+    groups = [[]]
+    for word in terms.split():
+        if word.upper() == 'OR':
+            groups.append([])
+        elif word.upper() != 'AND':
+            groups[-1].extend(tokenize_bio(word))
+    
+    groups = [words for words in groups if words != []]
+    if groups == []:
+        return set(twitter_data)
+    
+    matches = set()
+    for words in groups:
+        matches.update(_bio_search_words(bio_index, words))
+    return matches
+
+def bio_phrase_search(twitter_data, bio_index, phrase):
+    """ (Twitterverse dictionary, Bio index, str) -> set of str
+    
+    Return the usernames in twitter_data whose bios have the words of phrase
+    next to each other and in order, using bio_index, the Bio index of
+    twitter_data. If phrase has no words, every user matches.
+    
+    >>> twitter_data = {\
+    'a':{'name':'', 'location':'', 'web':'', 'bio':'Love music', 'following':[]}, \
+    'b':{'name':'', 'location':'', 'web':'', 'bio':'music, love', 'following':[]}, \
+    'c':{'name':'', 'location':'', 'web':'', 'bio':'', 'following':[]}}
+    >>> bio_index = build_bio_index(twitter_data)
+    >>> sorted(bio_phrase_search(twitter_data, bio_index, 'love MUSIC'))
+    ['a']
+    >>> sorted(bio_phrase_search(twitter_data, bio_index, 'music'))
+    ['a', 'b']
+    >>> sorted(bio_phrase_search(twitter_data, bio_index, ''))
+    ['a', 'b', 'c']
+    """
+    
+    words = tokenize_bio(phrase)
+    if words == []:
+        return set(twitter_data)
+    
+    matches = set()
+    for user in _bio_search_words(bio_index, words):
+        # The phrase matches where every word i is at position start + i.
+        starts = set(bio_index[words[0]][user])
+        for i in range(1, len(words)):
+            starts.intersection_update(position - i for position
+                                       in bio_index[words[i]][user])
+        if starts:
+            matches.add(user)
+    return matches
+
+def _bio_search_words(bio_index, words):
+    """ (Bio index, list of str) -> set of str
+    
+    Return the usernames whose bios have every word in words.
+    """
+    
+    # Intersect the shortest posting lists first.
+    postings = [bio_index.get(word, {}) for word in words]
+    postings.sort(key=len)
+    users = set(postings[0])
+    for posting in postings[1:]:
+        users.intersection_update(posting)
+    return users
+
+def save_data(data_file, twitter_data, bio_index):
+    """ (file open for writing in binary mode, Twitterverse dictionary, Bio index) -> NoneType
+    
+    Write twitter_data and its bio_index to data_file so that load_data can
+    read them back without parsing the data file or rebuilding the index.
+    
+    >>> twitter_data = {\
+    'a':{'name':'A', 'location':'', 'web':'', 'bio':'Love music', 'following':[]}}
+    >>> data_file = io.BytesIO()
+    >>> save_data(data_file, twitter_data, build_bio_index(twitter_data))
+    >>> _ = data_file.seek(0)
+    >>> load_data(data_file) == (twitter_data, build_bio_index(twitter_data))
+    True
+    """
+    
+    pickle.dump((twitter_data, bio_index), data_file, pickle.HIGHEST_PROTOCOL)
+
+def load_data(data_file):
+    """ (file open for reading in binary mode) -> (Twitterverse dictionary, Bio index)
+    
+    Read and return the Twitterverse dictionary and Bio index written to
+    data_file by save_data.
+    """
+    
+    return pickle.load(data_file)
+
+
 # --- Sorting Helper Functions ---
 def tweet_sort(twitter_data, results, cmp):
     """ (Twitterverse dictionary, list of str, function) -> NoneType
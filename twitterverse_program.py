@@ -3,9 +3,17 @@ import twitterverse_functions as tf
 if __name__ == '__main__':
     
     data_filename = input('Data file: ')
-    data_file = open(data_filename, 'r')
-    data = tf.process_data(data_file)
-    data_file.close()
+    if data_filename.endswith('.pkl'):
+        # A snapshot written by twitterverse_snapshot.py: the data and its
+        # bio index, already built.
+        data_file = open(data_filename, 'rb')
+        data, bio_index = tf.load_data(data_file)
+        data_file.close()
+    else:
+        # Only the follow graph is read up front. get_filter_results builds
+        # the bio index if the query has a bio filter.
+        data = tf.process_data_lazy(data_filename)
+        bio_index = None
     
     query_filename = input('Query file: ')
     query_file = open(query_filename, 'r')
@@ -14,7 +22,7 @@ if __name__ == '__main__':
         
     search_results = tf.get_search_results(data, query['search'])
     filtered_results = tf.get_filter_results(data, search_results, 
-                                             query['filter'])
+                                             query['filter'], bio_index)
     presented_results = tf.get_present_string(data, filtered_results, 
                                               query['present'])
     
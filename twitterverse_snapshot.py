@@ -0,0 +1,16 @@
+import twitterverse_functions as tf
+
+if __name__ == '__main__':
+    
+    data_filename = input('Data file: ')
+    data_file = open(data_filename, 'r')
+    data = tf.process_data(data_file)
+    data_file.close()
+    bio_index = tf.build_bio_index(data)
+    
+    snapshot_filename = input('Snapshot file (ending in .pkl): ')
+    snapshot_file = open(snapshot_filename, 'wb')
+    tf.save_data(snapshot_file, data, bio_index)
+    snapshot_file.close()
+    
+    print('Saved {0} users to {1}'.format(len(data), snapshot_filename))
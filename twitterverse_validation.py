@@ -0,0 +1,242 @@
+"""
+Validation of Twitterverse and Query dictionaries.
+
+Each validate function walks its dictionary once and returns a list of error
+messages (a list of str) instead of stopping at the first problem. An empty
+list means the dictionary is valid.
+"""
+
+import collections.abc
+import random
+
+import twitterverse_functions
+
+USER_KEYS = ['name', 'location', 'web', 'bio', 'following']
+SEARCH_OPERATIONS = ['following', 'followers']
+FILTER_KEYS = ['following', 'follower', 'name-includes', 'location-includes',
+               'bio-includes', 'bio-terms']
+SORT_BY_VALUES = ['username', 'name', 'popularity']
+FORMAT_VALUES = ['short', 'long']
+
+
+def validate_twitterverse(data_dict, fraction=1.0, seed=None,
+                          check_references=True, max_errors=100):
+    """(Twitterverse dictionary, float, object, bool, int) -> list of str
+
+    Return a list of messages describing every way data_dict does not match
+    the Twitterverse dictionary format, stopping after max_errors messages.
+
+    Only about fraction of the users (chosen at random using seed) are
+    checked. If check_references is True, every username in a checked
+    user's 'following' list must also be a user in data_dict. For a user
+    from process_data_lazy whose other fields have not been read yet, only
+    'following' is checked, so validating does not read them.
+
+    >>> data_dict = {'a': {'name': 'A', 'location': '', 'web': '', \
+'bio': '', 'following': ['b']}, 'b': {'name': 'B', 'location': '', \
+'web': '', 'bio': '', 'following': []}}
+    >>> validate_twitterverse(data_dict)
+    []
+    >>> data_dict['b']['following'] = ['c']
+    >>> del data_dict['b']['web']
+    >>> validate_twitterverse(data_dict)
+    ["user 'b' is missing key 'web'", "user 'b' follows unknown user 'c'"]
+    >>> validate_twitterverse(data_dict, check_references=False)
+    ["user 'b' is missing key 'web'"]
+
+    >>> data_dict = {}
+    >>> for username in 'abcdefghij':
+    ...     data_dict[username] = {'name': '', 'location': '', 'web': '', \
+'bio': '', 'following': ['x']}
+    >>> len(validate_twitterverse(data_dict))
+    10
+    >>> validate_twitterverse(data_dict, fraction=0.3, seed=1)
+    ["user 'a' follows unknown user 'x'", "user 'd' follows unknown user 'x'", \
+"user 'i' follows unknown user 'x'", "user 'j' follows unknown user 'x'"]
+    >>> validate_twitterverse(data_dict, fraction=0.3, seed=1, max_errors=2)
+    ["user 'a' follows unknown user 'x'", "user 'd' follows unknown user 'x'"]
+
+    >>> import os, tempfile
+    >>> data_file = tempfile.NamedTemporaryFile('w', delete=False)
+    >>> _ = data_file.write('a\\nA\\n\\n\\nENDBIO\\nb\\nEND\\n'
+    ...                     'b\\nB\\n\\n\\nENDBIO\\nc\\nEND\\n')
+    >>> data_file.close()
+    >>> data_dict = twitterverse_functions.process_data_lazy(data_file.name)
+    >>> validate_twitterverse(data_dict)
+    ["user 'b' follows unknown user 'c'"]
+    >>> data_dict['a'].is_loaded() or data_dict['b'].is_loaded()
+    False
+    >>> del data_dict
+    >>> os.remove(data_file.name)
+    """
+    errors = []
+    if not isinstance(data_dict, dict):
+        return ['Twitterverse dictionary should be a dict, but is {0}'
+                .format(type(data_dict))]
+
+    rng = random.Random(seed)
+    for username in data_dict:
+        if len(errors) >= max_errors:
+            break
+        if fraction < 1.0 and rng.random() >= fraction:
+            continue
+        _check_user(data_dict, username, check_references, errors)
+
+    return errors[:max_errors]
+
+
+def _check_user(data_dict, username, check_references, errors):
+    """(Twitterverse dictionary, object, bool, list of str) -> NoneType
+
+    Append to errors a message for each problem with the user username in
+    data_dict.
+    """
+    if not isinstance(username, str):
+        errors.append('username {0!r} should be a str, but is {1}'
+                      .format(username, type(username)))
+        return
+
+    user = data_dict[username]
+    if not isinstance(user, collections.abc.Mapping):
+        errors.append('user {0!r} should be a dict, but is {1}'
+                      .format(username, type(user)))
+        return
+
+    for key in USER_KEYS:
+        if key not in user:
+            errors.append('user {0!r} is missing key {1!r}'
+                          .format(username, key))
+    for key in user:
+        if key not in USER_KEYS:
+            errors.append('user {0!r} has unexpected key {1!r}'
+                          .format(username, key))
+
+    # Reading a lazy user's text fields would load them, and they are always
+    # str, so check only its 'following' list.
+    if isinstance(user, twitterverse_functions.LazyUser) and \
+       not user.is_loaded():
+        text_keys = []
+    else:
+        text_keys = USER_KEYS[:-1]
+    for key in text_keys:
+        if key in user and not isinstance(user[key], str):
+            errors.append('user {0!r} key {1!r} should be a str, but is {2}'
+                          .format(username, key, type(user[key])))
+
+    if 'following' not in user:
+        return
+    following = user['following']
+    if not isinstance(following, list):
+        errors.append("user {0!r} key 'following' should be a list, but is {1}"
+                      .format(username, type(following)))
+        return
+    for other in following:
+        if not isinstance(other, str):
+            errors.append("user {0!r} key 'following' should hold str, but "
+                          "holds {1}".format(username, type(other)))
+        elif check_references and other not in data_dict:
+            errors.append('user {0!r} follows unknown user {1!r}'
+                          .format(username, other))
+
+
+def validate_query(query_dict):
+    """(Query dictionary) -> list of str
+
+    Return a list of messages describing every way query_dict does not match
+    the Query dictionary format.
+
+    >>> query_dict = {'search': {'username': 'a', 'operations': ['following']}, \
+'filter': {'name-includes': 'b'}, \
+'present': {'sort-by': 'name', 'format': 'long'}}
+    >>> validate_query(query_dict)
+    []
+    >>> query_dict['search']['operations'] = ['friends']
+    >>> query_dict['present']['format'] = 'wide'
+    >>> validate_query(query_dict)
+    ["invalid search operation 'friends'", "invalid format 'wide'"]
+    """
+    if not isinstance(query_dict, dict):
+        return ['Query dictionary should be a dict, but is {0}'
+                .format(type(query_dict))]
+
+    errors = []
+    for key in query_dict:
+        if key not in ['search', 'filter', 'present']:
+            errors.append('unexpected key {0!r} in query dictionary'
+                          .format(key))
+
+    for key in ['search', 'filter', 'present']:
+        if key not in query_dict:
+            errors.append('key {0!r} missing from query dictionary'
+                          .format(key))
+        elif not isinstance(query_dict[key], dict):
+            errors.append('key {0!r} should have a dict value, but has {1}'
+                          .format(key, type(query_dict[key])))
+
+    if not errors:
+        _check_search(query_dict['search'], errors)
+        _check_filter(query_dict['filter'], errors)
+        _check_present(query_dict['present'], errors)
+    return errors
+
+
+def _check_search(search_dict, errors):
+    """(search specification dictionary, list of str) -> NoneType
+
+    Append to errors a message for each problem with search_dict.
+    """
+    if len(search_dict) != 2:
+        errors.append('search spec dictionary has incorrect length')
+    if not isinstance(search_dict.get('username'), str):
+        errors.append("key 'username' should have value of type str, "
+                      "but has value of type {0}"
+                      .format(type(search_dict.get('username'))))
+
+    operations = search_dict.get('operations')
+    if not isinstance(operations, list):
+        errors.append("key 'operations' should have value of type list, "
+                      "but has value of type {0}".format(type(operations)))
+        return
+    for operation in operations:
+        if operation not in SEARCH_OPERATIONS:
+            errors.append('invalid search operation {0!r}'.format(operation))
+
+
+def _check_filter(filter_dict, errors):
+    """(filter specification dictionary, list of str) -> NoneType
+
+    Append to errors a message for each problem with filter_dict.
+    """
+    for key in filter_dict:
+        if key not in FILTER_KEYS:
+            errors.append('invalid key {0!r} in filter specification '
+                          'dictionary'.format(key))
+        if not isinstance(filter_dict[key], str):
+            errors.append('values in filter specification dictionary should '
+                          'have type str, but has type {0}'
+                          .format(type(filter_dict[key])))
+
+
+def _check_present(present_dict, errors):
+    """(presentation specification dictionary, list of str) -> NoneType
+
+    Append to errors a message for each problem with present_dict.
+    """
+    if len(present_dict) != 2:
+        errors.append('present spec dictionary has incorrect length')
+
+    for key, values in [('sort-by', SORT_BY_VALUES), ('format', FORMAT_VALUES)]:
+        if key not in present_dict:
+            errors.append('key {0!r} missing from present specification '
+                          'dictionary'.format(key))
+        elif not isinstance(present_dict[key], str):
+            errors.append('key {0!r} should have value of type str, but has '
+                          'value of type {1}'
+                          .format(key, type(present_dict[key])))
+        elif present_dict[key] not in values:
+            errors.append('invalid {0} {1!r}'.format(key, present_dict[key]))
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod()